@@ -3,6 +3,8 @@ Configuration file for chess engine containing piece values and piece-square tab
 All values are in centipawns (pawn = 100).
 """
 
+from array import array
+
 # Piece values in centipawns
 PAWN_VALUE = 100
 KNIGHT_VALUE = 320
@@ -87,19 +89,18 @@ KING_PST = [
     20, 30, 10,  0,  0, 10, 30, 20
 ]
 
-# Black PSTs are mirrors of White PSTs (flip vertically)
-def get_black_pst(white_pst):
-    """Convert a white piece-square table to black by flipping it vertically."""
-    black_pst = []
-    for rank in range(7, -1, -1):  # Reverse rank order
-        for file in range(8):
-            black_pst.append(white_pst[rank * 8 + file])
-    return black_pst
+# Combined piece-square table for both colors, indexed as
+# PST[(color * 6 + piece_type - 1) * 64 + square], where color is 0 for Black
+# and 1 for White and piece_type runs from 1 (pawn) to 6 (king).
+# Black tables are the White tables flipped vertically.
+def build_pst():
+    """Build the flat piece-square table array for both colors."""
+    white_psts = [PAWN_PST, KNIGHT_PST, BISHOP_PST, ROOK_PST, QUEEN_PST, KING_PST]
+    pst = array('h', [0] * (2 * 6 * 64))
+    for piece_index, white_pst in enumerate(white_psts):
+        for square in range(64):
+            pst[(6 + piece_index) * 64 + square] = white_pst[square]
+            pst[piece_index * 64 + square] = white_pst[square ^ 56]
+    return pst
 
-# Black piece-square tables
-PAWN_PST_BLACK = get_black_pst(PAWN_PST)
-KNIGHT_PST_BLACK = get_black_pst(KNIGHT_PST)
-BISHOP_PST_BLACK = get_black_pst(BISHOP_PST)
-ROOK_PST_BLACK = get_black_pst(ROOK_PST)
-QUEEN_PST_BLACK = get_black_pst(QUEEN_PST)
-KING_PST_BLACK = get_black_pst(KING_PST)
+PST = build_pst()
@@ -1,231 +1,617 @@
 """
-Enhanced chess engine module implementing Minimax algorithm with Alpha-Beta pruning.
+Enhanced chess engine module implementing Negamax with Principal Variation Search.
 Includes move ordering, iterative deepening, and advanced search techniques.
 """
 
+import time
+from operator import itemgetter
+
 import chess
-from evaluation import evaluate_board
+import chess.polyglot
+from evaluation import evaluate_board, SearchBoard, CENTER_SQUARES
+
+
+# Piece values used for MVV-LVA move ordering
+PIECE_VALUES = {
+    chess.PAWN: 100, chess.KNIGHT: 320, chess.BISHOP: 330,
+    chess.ROOK: 500, chess.QUEEN: 900, chess.KING: 20000
+}
+
+# Score of being checkmated at the root, as returned by evaluate_board
+# (mates closer to the root score higher)
+MATE_SCORE = 999999
+
+# Scores at least this far from zero are mate scores
+MATE_BOUND = MATE_SCORE - 1000
+
+# Window bound beyond any reachable score (kept finite so window arithmetic stays exact)
+INFINITY = MATE_SCORE + 1
+
+
+class SearchAborted(Exception):
+    """Raised inside the search when the time limit for the current move runs out."""
+
+
+# time.monotonic() value after which the running search is aborted (None = no limit)
+SEARCH_DEADLINE = None
+
+# Transposition table bound flags
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+
+# Maximum number of positions kept in the transposition table
+TT_MAX_ENTRIES = 1000000
+
+# Transposition table: zobrist key -> (depth, flag, value, best_move)
+TT = {}
+
+
+def clear_transposition_table():
+    """Forget all stored positions (call between games)."""
+    TT.clear()
+
+
+def score_to_tt(value: int, ply: int) -> int:
+    """Convert a root-relative mate score to one relative to the node being stored."""
+    if value >= MATE_BOUND:
+        return value + ply
+    if value <= -MATE_BOUND:
+        return value - ply
+    return value
+
+
+def score_from_tt(value: int, ply: int) -> int:
+    """Convert a node-relative mate score from the table back to one relative to the root."""
+    if value >= MATE_BOUND:
+        return value - ply
+    if value <= -MATE_BOUND:
+        return value + ply
+    return value
+
 
+def store_transposition(key: int, depth: int, flag: int, value: int, best_move: chess.Move, ply: int = 0):
+    """Store a search result, preferring entries searched to a greater depth."""
+    entry = TT.get(key)
+    if entry is not None and entry[0] > depth:
+        return
+    if entry is None and len(TT) >= TT_MAX_ENTRIES:
+        TT.clear()
+    TT[key] = (depth, flag, score_to_tt(value, ply), best_move)
 
-def order_moves(board: chess.Board, moves: list) -> list:
+
+# Safety margin for delta pruning in quiescence search
+DELTA_MARGIN = 200
+
+# Depth reduction applied to the null-move search
+NULL_MOVE_REDUCTION = 2
+
+# Below this many pieces on the board, null-move pruning is skipped (zugzwang risk)
+NULL_MOVE_MIN_PIECES = 12
+
+# Initial half-width of the aspiration window around the previous score
+ASPIRATION_WINDOW = 50
+
+# Beyond this margin a failing aspiration window is opened up completely
+ASPIRATION_MAX_MARGIN = 1000
+
+# Maximum search ply tracked by the killer move table
+MAX_PLY = 64
+
+# Killer moves: two quiet moves per ply that recently caused a beta cutoff
+KILLERS = [[None, None] for _ in range(MAX_PLY)]
+
+# History heuristic: HISTORY[from_square][to_square] grows with quiet cutoffs
+HISTORY = [[0] * 64 for _ in range(64)]
+
+# Cap on the history bonus so quiet moves stay below the killers and the capture scores
+HISTORY_MAX_BONUS = 80
+
+
+def clear_move_ordering_tables():
+    """Reset the killer move and history tables (call before a new root search)."""
+    for killers in KILLERS:
+        killers[0] = None
+        killers[1] = None
+    for row in HISTORY:
+        for index in range(64):
+            row[index] = 0
+
+
+def attackers_to(board: chess.Board, square: chess.Square, occupied: chess.Bitboard) -> chess.Bitboard:
+    """Pieces of either color attacking a square, given a custom occupancy (for x-rays)."""
+    queens_and_rooks = board.queens | board.rooks
+    queens_and_bishops = board.queens | board.bishops
+    attackers = (
+        (chess.BB_KING_ATTACKS[square] & board.kings) |
+        (chess.BB_KNIGHT_ATTACKS[square] & board.knights) |
+        (chess.BB_RANK_ATTACKS[square][chess.BB_RANK_MASKS[square] & occupied] & queens_and_rooks) |
+        (chess.BB_FILE_ATTACKS[square][chess.BB_FILE_MASKS[square] & occupied] & queens_and_rooks) |
+        (chess.BB_DIAG_ATTACKS[square][chess.BB_DIAG_MASKS[square] & occupied] & queens_and_bishops) |
+        (chess.BB_PAWN_ATTACKS[chess.BLACK][square] & board.pawns & board.occupied_co[chess.WHITE]) |
+        (chess.BB_PAWN_ATTACKS[chess.WHITE][square] & board.pawns & board.occupied_co[chess.BLACK])
+    )
+    return attackers & occupied
+
+
+def move_gives_check(board: chess.Board, move: chess.Move) -> bool:
+    """
+    Test whether a move gives check using attack bitboards, without making it.
+    
+    chess.Board.gives_check pushes and pops the move; here only castling and
+    en passant (rare, with rook or discovered-capture checks) fall back to it.
+    """
+    if board.is_castling(move) or board.is_en_passant(move):
+        return board.gives_check(move)
+    
+    color = board.turn
+    king_square = board.king(not color)
+    if king_square is None:
+        return False
+    
+    from_mask = chess.BB_SQUARES[move.from_square]
+    to_square = move.to_square
+    occupied = (board.occupied & ~from_mask) | chess.BB_SQUARES[to_square]
+    
+    # Discovered check: a friendly slider attacks the king once the mover has left
+    if attackers_to(board, king_square, occupied) & board.occupied_co[color] & ~from_mask:
+        return True
+    
+    # Direct check from the moved (or promoted) piece on its new square
+    piece_type = move.promotion or board.piece_type_at(move.from_square)
+    if piece_type == chess.PAWN:
+        attacks = chess.BB_PAWN_ATTACKS[color][to_square]
+    elif piece_type == chess.KNIGHT:
+        attacks = chess.BB_KNIGHT_ATTACKS[to_square]
+    elif piece_type == chess.KING:
+        return False
+    else:
+        attacks = 0
+        if piece_type != chess.BISHOP:
+            attacks |= (chess.BB_RANK_ATTACKS[to_square][chess.BB_RANK_MASKS[to_square] & occupied] |
+                        chess.BB_FILE_ATTACKS[to_square][chess.BB_FILE_MASKS[to_square] & occupied])
+        if piece_type != chess.ROOK:
+            attacks |= chess.BB_DIAG_ATTACKS[to_square][chess.BB_DIAG_MASKS[to_square] & occupied]
+    return bool(attacks & chess.BB_SQUARES[king_square])
+
+
+def move_priority(board: chess.Board, move: chess.Move, ply: int = None,
+                  is_capture: bool = None, gives_check: bool = None) -> int:
+    """
+    Score a move for ordering; higher scores are searched first.
+    
+    When a ply is given, quiet moves are also ranked by the killer move and
+    history tables filled in during the search. Callers that already know
+    whether the move captures or gives check can pass those flags in.
+    """
+    if is_capture is None:
+        is_capture = board.is_capture(move)
+    if gives_check is None:
+        gives_check = move_gives_check(board, move)
+    
+    priority = 0
+    
+    # Prioritize captures
+    if is_capture:
+        captured_piece = board.piece_at(move.to_square)
+        moving_piece = board.piece_at(move.from_square)
+        if captured_piece and moving_piece:
+            # MVV-LVA (Most Valuable Victim - Least Valuable Attacker)
+            priority += PIECE_VALUES[captured_piece.piece_type] * 10
+            priority -= PIECE_VALUES[moving_piece.piece_type]
+    elif ply is not None:
+        # Prioritize quiet moves that caused cutoffs elsewhere in the tree
+        killers = KILLERS[ply]
+        if move == killers[0] or move == killers[1]:
+            priority += 90
+        priority += min(HISTORY[move.from_square][move.to_square], HISTORY_MAX_BONUS)
+    
+    # Prioritize checks
+    if gives_check:
+        priority += 50
+    
+    # Prioritize promotions
+    if move.promotion:
+        priority += 800
+    
+    # Prioritize castling
+    if board.is_castling(move):
+        priority += 60
+    
+    # Prioritize center moves
+    if move.to_square in CENTER_SQUARES:
+        priority += 20
+    
+    return priority
+
+
+def order_moves(board: chess.Board, moves: list, ply: int = None) -> list:
     """Order moves for better alpha-beta pruning efficiency."""
-    def move_priority(move):
-        priority = 0
-        
-        # Prioritize captures
-        if board.is_capture(move):
-            captured_piece = board.piece_at(move.to_square)
-            moving_piece = board.piece_at(move.from_square)
-            if captured_piece and moving_piece:
-                # MVV-LVA (Most Valuable Victim - Least Valuable Attacker)
-                piece_values = {
-                    chess.PAWN: 100, chess.KNIGHT: 320, chess.BISHOP: 330,
-                    chess.ROOK: 500, chess.QUEEN: 900, chess.KING: 20000
-                }
-                priority += piece_values[captured_piece.piece_type] * 10
-                priority -= piece_values[moving_piece.piece_type]
-        
-        # Prioritize checks
-        board.push(move)
-        if board.is_check():
-            priority += 50
-        board.pop()
-        
-        # Prioritize promotions
-        if move.promotion:
-            priority += 800
-        
-        # Prioritize castling
-        if board.is_castling(move):
-            priority += 60
+    return sorted(moves, key=lambda move: move_priority(board, move, ply), reverse=True)
+
+
+def static_exchange_evaluation(board: chess.Board, move: chess.Move) -> int:
+    """
+    Static exchange evaluation (SEE) of a capture.
+    
+    Plays out the sequence of captures on the target square, each side always
+    recapturing with its least valuable attacker and free to stop, and returns
+    the expected material gain for the side making the move.
+    """
+    to_square = move.to_square
+    occupied = board.occupied ^ chess.BB_SQUARES[move.from_square]
+    
+    if board.is_en_passant(move):
+        captured_type = chess.PAWN
+        occupied ^= chess.BB_SQUARES[to_square - 8 if board.turn == chess.WHITE else to_square + 8]
+    else:
+        captured_type = board.piece_type_at(to_square)
+        if captured_type is None:
+            return 0
+    
+    gains = [PIECE_VALUES[captured_type]]
+    attacker_type = move.promotion or board.piece_type_at(move.from_square)
+    color = not board.turn
+    
+    while True:
+        attackers = attackers_to(board, to_square, occupied) & board.occupied_co[color]
+        if not attackers:
+            break
         
-        # Prioritize center moves
-        center_squares = [chess.E4, chess.E5, chess.D4, chess.D5]
-        if move.to_square in center_squares:
-            priority += 20
+        # Recapture with the least valuable attacker
+        for piece_type in chess.PIECE_TYPES:
+            piece_attackers = attackers & board.pieces_mask(piece_type, color)
+            if piece_attackers:
+                break
         
-        return priority
+        gains.append(PIECE_VALUES[attacker_type] - gains[-1])
+        attacker_type = piece_type
+        occupied ^= chess.BB_SQUARES[chess.lsb(piece_attackers)]
+        color = not color
+    
+    # Each side may decline to continue the exchange
+    while len(gains) > 1:
+        gains[-2] = -max(-gains[-2], gains[-1])
+        gains.pop()
     
-    return sorted(moves, key=move_priority, reverse=True)
+    return gains[0]
 
 
-def quiescence_search(board: chess.Board, alpha: int, beta: int, depth: int = 0) -> int:
-    """Quiescence search to avoid horizon effect in tactical positions."""
-    if depth > 10:  # Prevent infinite recursion
-        return evaluate_board(board)
+def quiescence_search(board: chess.Board, alpha: int, beta: int, depth: int = 0, ply: int = 0) -> int:
+    """
+    Quiescence search to avoid horizon effect in tactical positions.
+    
+    Captures that cannot raise the score to alpha even with a safety margin
+    (delta pruning) or that lose material in the exchange (SEE) are skipped;
+    checking moves are always searched.
+    
+    Results are shared with negamax through the transposition table as
+    depth 0 entries, which deeper negamax entries replace.
+    """
+    # Probe the transposition table; every stored entry is at least this deep
+    key = chess.polyglot.zobrist_hash(board)
+    entry = TT.get(key)
+    if entry is not None:
+        tt_flag = entry[1]
+        tt_value = score_from_tt(entry[2], ply)
+        if (tt_flag == TT_EXACT or
+                (tt_flag == TT_LOWER and tt_value >= beta) or
+                (tt_flag == TT_UPPER and tt_value <= alpha)):
+            return tt_value
     
     # Stand pat evaluation
     stand_pat = evaluate_board(board)
     
+    if stand_pat == -MATE_SCORE:
+        # Checkmated - score mates closer to the root higher
+        return -MATE_SCORE + ply
+    
+    if depth > 10:  # Prevent infinite recursion
+        return stand_pat
+    
     if stand_pat >= beta:
+        store_transposition(key, 0, TT_LOWER, stand_pat, None, ply)
         return beta
+    
+    alpha_orig = alpha
     if stand_pat > alpha:
         alpha = stand_pat
     
-    # Only search captures and checks in quiescence
-    moves = []
+    # Bind hot global and attribute lookups to locals once per node
+    gives_check = move_gives_check
+    is_capture = board.is_capture
+    piece_type_at = board.piece_type_at
+    
+    # Only search captures and checks in quiescence, scoring them in the same pass
+    scored_moves = []
+    add_move = scored_moves.append
     for move in board.legal_moves:
-        if board.is_capture(move) or board.gives_check(move):
-            moves.append(move)
+        capture = is_capture(move)
+        if gives_check(board, move):
+            add_move((move_priority(board, move, None, capture, True), move))
+        elif capture:
+            # Delta pruning: skip captures that cannot bring the score up to alpha
+            captured_type = piece_type_at(move.to_square) or chess.PAWN  # en passant
+            gain = PIECE_VALUES[captured_type]
+            if move.promotion:
+                gain += PIECE_VALUES[move.promotion] - PIECE_VALUES[chess.PAWN]
+            if stand_pat + gain + DELTA_MARGIN < alpha:
+                continue
+            
+            # Skip captures that lose material in the exchange
+            if static_exchange_evaluation(board, move) < 0:
+                continue
+            
+            add_move((move_priority(board, move, None, True, False), move))
     
-    if not moves:
+    if not scored_moves:
+        flag = TT_UPPER if stand_pat <= alpha_orig else TT_EXACT
+        store_transposition(key, 0, flag, stand_pat, None, ply)
         return stand_pat
     
     # Order moves for better pruning
-    moves = order_moves(board, moves)
+    scored_moves.sort(key=itemgetter(0), reverse=True)
     
-    for move in moves:
-        board.push(move)
-        score = -quiescence_search(board, -beta, -alpha, depth + 1)
-        board.pop()
+    best_move = None
+    push = board.push
+    pop = board.pop
+    for _, move in scored_moves:
+        push(move)
+        score = -quiescence_search(board, -beta, -alpha, depth + 1, ply + 1)
+        pop()
         
         if score >= beta:
+            store_transposition(key, 0, TT_LOWER, beta, move, ply)
             return beta
         if score > alpha:
             alpha = score
+            best_move = move
     
+    flag = TT_UPPER if alpha <= alpha_orig else TT_EXACT
+    store_transposition(key, 0, flag, alpha, best_move, ply)
     return alpha
 
 
-def search(board: chess.Board, depth: int, alpha: int, beta: int, maximizing_player: bool) -> int:
+def negamax(board: chess.Board, depth: int, alpha: int, beta: int, ply: int = 0) -> int:
     """
-    Minimax search with Alpha-Beta pruning.
+    Negamax search with Principal Variation Search (PVS).
+    
+    The first move is searched with the full window and the remaining moves
+    with a zero-width window, re-searching only when one of them fails high.
     
     Args:
         board: Current chess board position
         depth: Search depth remaining
-        alpha: Alpha value for pruning (best value maximizing player can guarantee)
-        beta: Beta value for pruning (best value minimizing player can guarantee)
-        maximizing_player: True if current player is maximizing, False if minimizing
+        alpha: Lower bound of the search window (side to move)
+        beta: Upper bound of the search window (side to move)
+        ply: Distance from the root, used to index the killer move table
         
     Returns:
-        int: Evaluation score of the position
+        int: Evaluation score of the position from the side to move's perspective
     """
     
-    # Base case: if depth is 0 or game is over
-    if board.is_game_over():
-        return evaluate_board(board)
+    # Stop cooperatively once the time limit has passed
+    if SEARCH_DEADLINE is not None and time.monotonic() > SEARCH_DEADLINE:
+        raise SearchAborted
     
     if depth == 0:
         # Use quiescence search instead of static evaluation
-        return quiescence_search(board, alpha, beta)
+        return quiescence_search(board, alpha, beta, 0, ply)
     
-    # Get and order moves for better pruning
+    # Draw by the fifty-move rule (unless the last move delivered mate)
+    if board.halfmove_clock >= 100:
+        return -MATE_SCORE + ply if board.is_checkmate() else 0
+    
+    # Probe the transposition table
+    key = chess.polyglot.zobrist_hash(board)
+    entry = TT.get(key)
+    tt_move = None
+    if entry is not None:
+        tt_depth, tt_flag, tt_value, tt_move = entry
+        tt_value = score_from_tt(tt_value, ply)
+        if tt_depth >= depth:
+            if tt_flag == TT_EXACT:
+                return tt_value
+            if tt_flag == TT_LOWER:
+                alpha = max(alpha, tt_value)
+            elif tt_flag == TT_UPPER:
+                beta = min(beta, tt_value)
+            if alpha >= beta:
+                return tt_value
+    
+    # Generate moves once; no legal moves means checkmate or stalemate
     moves = list(board.legal_moves)
     if not moves:
-        return evaluate_board(board)
+        return -MATE_SCORE + ply if board.is_check() else 0
     
-    moves = order_moves(board, moves)
+    # Null-move pruning: if passing still fails high, the position is good enough
+    if (depth >= 3 and not board.is_check() and abs(beta) < MATE_BOUND
+            and board.occupied_co[board.turn] & ~board.pawns & ~board.kings
+            and chess.popcount(board.occupied) >= NULL_MOVE_MIN_PIECES):
+        board.push(chess.Move.null())
+        null_score = -negamax(board, depth - 1 - NULL_MOVE_REDUCTION, -beta, -beta + 1, ply + 1)
+        board.pop()
+        if null_score >= beta:
+            return beta
+    
+    # Order moves for better pruning
+    moves = order_moves(board, moves, ply)
+    
+    # Search the stored best move first
+    if tt_move is not None and tt_move in moves:
+        moves.remove(tt_move)
+        moves.insert(0, tt_move)
     
-    if maximizing_player:
-        # Maximizing player tries to maximize the score
-        max_eval = float('-inf')
+    alpha_orig = alpha
+    best_eval = -INFINITY
+    best_move = None
+    
+    # Try all legal moves (now ordered)
+    for index, move in enumerate(moves):
+        # Make the move
+        board.push(move)
         
-        # Try all legal moves (now ordered)
-        for move in moves:
-            # Make the move
-            board.push(move)
-            
-            # Recursively search with reduced depth and switch to minimizing player
-            eval_score = search(board, depth - 1, alpha, beta, False)
-            
-            # Undo the move
-            board.pop()
-            
-            # Update maximum evaluation
-            max_eval = max(max_eval, eval_score)
-            
-            # Alpha-Beta pruning
-            alpha = max(alpha, eval_score)
-            if beta <= alpha:
-                break  # Beta cutoff - minimizing player won't choose this path
+        if index == 0:
+            # Search the expected best move with the full window
+            eval_score = -negamax(board, depth - 1, -beta, -alpha, ply + 1)
+        else:
+            # Zero-window search to prove the move is no better than alpha
+            eval_score = -negamax(board, depth - 1, -alpha - 1, -alpha, ply + 1)
+            if alpha < eval_score < beta:
+                # Fail high - re-search with the full window
+                eval_score = -negamax(board, depth - 1, -beta, -eval_score, ply + 1)
         
-        return max_eval
-    
-    else:
-        # Minimizing player tries to minimize the score
-        min_eval = float('inf')
+        # Undo the move
+        board.pop()
         
-        # Try all legal moves (now ordered)
-        for move in moves:
-            # Make the move
-            board.push(move)
-            
-            # Recursively search with reduced depth and switch to maximizing player
-            eval_score = search(board, depth - 1, alpha, beta, True)
-            
-            # Undo the move
-            board.pop()
-            
-            # Update minimum evaluation
-            min_eval = min(min_eval, eval_score)
-            
-            # Alpha-Beta pruning
-            beta = min(beta, eval_score)
-            if beta <= alpha:
-                break  # Alpha cutoff - maximizing player won't choose this path
+        # Update best evaluation
+        if eval_score > best_eval:
+            best_eval = eval_score
+            best_move = move
         
-        return min_eval
+        # Alpha-Beta pruning
+        alpha = max(alpha, eval_score)
+        if alpha >= beta:
+            # Remember quiet moves that cause a cutoff for move ordering
+            if not board.is_capture(move):
+                killers = KILLERS[ply]
+                if move != killers[0]:
+                    killers[1] = killers[0]
+                    killers[0] = move
+                HISTORY[move.from_square][move.to_square] += depth * depth
+            break  # Beta cutoff - opponent won't allow this position
+    
+    # Store the result with the kind of bound it represents
+    if best_eval <= alpha_orig:
+        flag = TT_UPPER
+    elif best_eval >= beta:
+        flag = TT_LOWER
+    else:
+        flag = TT_EXACT
+    store_transposition(key, depth, flag, best_eval, best_move, ply)
+    
+    return best_eval
 
 
 def iterative_deepening_search(board: chess.Board, max_depth: int, time_limit: float = None) -> chess.Move:
-    """Iterative deepening search for better move ordering and time management."""
-    import time
+    """
+    Iterative deepening search for better move ordering and time management.
     
-    start_time = time.time() if time_limit else None
+    From depth 2 on, each iteration starts with an aspiration window around
+    the previous iteration's score and widens it only when the score falls
+    outside.
+    """
+    global SEARCH_DEADLINE
+    
+    start_time = time.monotonic()
     best_move = None
+    prev_score = None
     
-    # Search with increasing depth
-    for depth in range(1, max_depth + 1):
-        if time_limit and start_time:
-            elapsed = time.time() - start_time
-            if elapsed > time_limit:
-                break
-        
-        try:
-            current_best = find_best_move(board, depth)
+    # Search on a board that maintains its evaluation incrementally
+    board = SearchBoard.from_board(board)
+    
+    # Start with fresh killer moves and history scores for this position
+    clear_move_ordering_tables()
+    
+    try:
+        # Search with increasing depth
+        for depth in range(1, max_depth + 1):
+            if time_limit:
+                if time.monotonic() - start_time > time_limit:
+                    break
+                # Only allow aborting mid-search once there is a move to fall back on
+                if best_move is not None:
+                    SEARCH_DEADLINE = start_time + time_limit
+            
+            if prev_score is None:
+                # No previous score to centre a window on - use the full window
+                alpha = -INFINITY
+                beta = INFINITY
+            else:
+                margin = ASPIRATION_WINDOW
+                alpha = prev_score - margin
+                beta = prev_score + margin
+            
+            while True:
+                current_best, score = root_search(board, depth, alpha, beta, best_move)
+                if current_best is None:
+                    break
+                
+                if score <= alpha:
+                    # Fail low - widen the window downwards and re-search
+                    margin *= 2
+                    alpha = prev_score - margin if margin < ASPIRATION_MAX_MARGIN else -INFINITY
+                elif score >= beta:
+                    # Fail high - widen the window upwards and re-search
+                    margin *= 2
+                    beta = prev_score + margin if margin < ASPIRATION_MAX_MARGIN else INFINITY
+                else:
+                    break
+            
             if current_best:
                 best_move = current_best
-        except:
-            break
+                prev_score = score
+    except SearchAborted:
+        # Out of time - keep the move from the last completed depth
+        pass
+    finally:
+        SEARCH_DEADLINE = None
     
-    return best_move or list(board.legal_moves)[0]
+    return best_move or next(iter(board.legal_moves), None)
 
 
-def find_best_move(board: chess.Board, depth: int) -> chess.Move:
+def root_search(board: chess.Board, depth: int, alpha: int, beta: int, prev_best: chess.Move = None) -> tuple:
     """
-    Find the best move for the current position using enhanced Minimax with Alpha-Beta pruning.
+    Principal Variation Search over the root moves within the window (alpha, beta).
     
     Args:
         board: Current chess board position
         depth: Search depth for the algorithm
+        alpha: Lower bound of the search window
+        beta: Upper bound of the search window
+        prev_best: Best move from the previous iteration, searched first
         
     Returns:
-        chess.Move: The best move found by the search algorithm
+        tuple: (best move, its score); the score is a bound if it falls outside the window,
+        and on a fail low the move is the one searched first (prev_best, the TT move,
+        or else the top move by ordering)
     """
     
     best_move = None
-    max_eval = float('-inf')
-    
-    # Initialize alpha and beta for Alpha-Beta pruning
-    alpha = float('-inf')
-    beta = float('inf')
+    max_eval = -INFINITY
     
     # Get and order moves for better pruning
     moves = list(board.legal_moves)
     if not moves:
-        return None
+        return None, max_eval
     
     moves = order_moves(board, moves)
     
+    # Search the previous iteration's best move first, or else the stored TT move
+    key = chess.polyglot.zobrist_hash(board)
+    first_move = prev_best
+    if first_move is None:
+        entry = TT.get(key)
+        if entry is not None:
+            first_move = entry[3]
+    if first_move is not None and first_move in moves:
+        moves.remove(first_move)
+        moves.insert(0, first_move)
+    
+    alpha_orig = alpha
+    
     # Try all legal moves for the current position (now ordered)
-    for move in moves:
+    for index, move in enumerate(moves):
         # Make the move
         board.push(move)
         
-        # Search the resulting position with the opponent as maximizing player
-        # (since we want to minimize the opponent's advantage)
-        eval_score = search(board, depth - 1, alpha, beta, False)
+        # Search the resulting position from the opponent's perspective
+        if index == 0:
+            eval_score = -negamax(board, depth - 1, -beta, -alpha, 1)
+        else:
+            eval_score = -negamax(board, depth - 1, -alpha - 1, -alpha, 1)
+            if alpha < eval_score < beta:
+                eval_score = -negamax(board, depth - 1, -beta, -eval_score, 1)
         
         # Undo the move
         board.pop()
@@ -237,5 +623,41 @@ def find_best_move(board: chess.Board, depth: int) -> chess.Move:
         
         # Update alpha for pruning in subsequent iterations
         alpha = max(alpha, eval_score)
+        if alpha >= beta:
+            break  # Fail high - the window has to be widened
+    
+    # Store the root result so later iterations and moves can reuse it
+    if max_eval <= alpha_orig:
+        # Fail low - every score is only an upper bound, so the highest one does
+        # not identify a best move; keep the move that was searched first
+        flag = TT_UPPER
+        best_move = moves[0]
+    elif max_eval >= beta:
+        flag = TT_LOWER
+    else:
+        flag = TT_EXACT
+    store_transposition(key, depth, flag, max_eval, best_move)
+    
+    return best_move, max_eval
+
+
+def find_best_move(board: chess.Board, depth: int) -> chess.Move:
+    """
+    Find the best move for the current position using Negamax with Principal Variation Search.
+    
+    Args:
+        board: Current chess board position
+        depth: Search depth for the algorithm
+        
+    Returns:
+        chess.Move: The best move found by the search algorithm
+    """
+    
+    if not isinstance(board, SearchBoard):
+        board = SearchBoard.from_board(board)
+    
+    # Start with fresh killer moves and history scores for this position
+    clear_move_ordering_tables()
     
+    best_move, _ = root_search(board, depth, -INFINITY, INFINITY)
     return best_move
@@ -6,33 +6,185 @@ Contains advanced board evaluation with material, positional, and tactical scori
 import chess
 from config import (
     PAWN_VALUE, KNIGHT_VALUE, BISHOP_VALUE, ROOK_VALUE, QUEEN_VALUE, KING_VALUE,
-    PAWN_PST, KNIGHT_PST, BISHOP_PST, ROOK_PST, QUEEN_PST, KING_PST,
-    PAWN_PST_BLACK, KNIGHT_PST_BLACK, BISHOP_PST_BLACK, 
-    ROOK_PST_BLACK, QUEEN_PST_BLACK, KING_PST_BLACK
+    PST
 )
 
 
+# Material value by piece type (the king is not counted as material)
+MATERIAL_VALUES = [0, PAWN_VALUE, KNIGHT_VALUE, BISHOP_VALUE, ROOK_VALUE, QUEEN_VALUE, 0]
+
+# Central squares rewarded for control and in move ordering
+CENTER_SQUARES = frozenset([chess.E4, chess.E5, chess.D4, chess.D5])
+
+# File bitboards and the files adjacent to each file
+FILE_BB = [chess.BB_FILES[file_idx] for file_idx in range(8)]
+ADJACENT_FILES_BB = [
+    (FILE_BB[file_idx - 1] if file_idx > 0 else 0) | (FILE_BB[file_idx + 1] if file_idx < 7 else 0)
+    for file_idx in range(8)
+]
+
+
+def king_shield_mask(square: chess.Square, color: chess.Color) -> chess.Bitboard:
+    """The three squares directly in front of a king that its pawns should occupy."""
+    rank = chess.square_rank(square) + (1 if color == chess.WHITE else -1)
+    if not 0 <= rank <= 7:
+        return 0
+    file_idx = chess.square_file(square)
+    return (FILE_BB[file_idx] | ADJACENT_FILES_BB[file_idx]) & chess.BB_RANKS[rank]
+
+
+# Pawn shield masks indexed as KING_SHIELD_MASKS[color][king_square]
+KING_SHIELD_MASKS = [
+    [king_shield_mask(square, color) for square in chess.SQUARES]
+    for color in (chess.BLACK, chess.WHITE)
+]
+
+
+def passed_pawn_mask(square: chess.Square, color: chess.Color) -> chess.Bitboard:
+    """Squares ahead of a pawn on its own and adjacent files that enemy pawns must not occupy."""
+    file_idx = chess.square_file(square)
+    rank = chess.square_rank(square)
+    ahead = range(rank + 1, 8) if color == chess.WHITE else range(rank)
+    ranks = 0
+    for ahead_rank in ahead:
+        ranks |= chess.BB_RANKS[ahead_rank]
+    return (FILE_BB[file_idx] | ADJACENT_FILES_BB[file_idx]) & ranks
+
+
+# Passed pawn masks indexed as PASSED_PAWN_MASKS[color][square]
+PASSED_PAWN_MASKS = [
+    [passed_pawn_mask(square, color) for square in chess.SQUARES]
+    for color in (chess.BLACK, chess.WHITE)
+]
+
+
 def count_material(board: chess.Board, color: chess.Color) -> int:
     """Count total material value for a given color."""
     material = 0
-    material += len(board.pieces(chess.PAWN, color)) * PAWN_VALUE
-    material += len(board.pieces(chess.KNIGHT, color)) * KNIGHT_VALUE
-    material += len(board.pieces(chess.BISHOP, color)) * BISHOP_VALUE
-    material += len(board.pieces(chess.ROOK, color)) * ROOK_VALUE
-    material += len(board.pieces(chess.QUEEN, color)) * QUEEN_VALUE
+    for piece_type in chess.PIECE_TYPES:
+        material += chess.popcount(board.pieces_mask(piece_type, color)) * MATERIAL_VALUES[piece_type]
     return material
 
 
+def count_positional(board: chess.Board, color: chess.Color) -> int:
+    """Sum the piece-square table values of all pieces of a given color."""
+    positional = 0
+    for piece_type in chess.PIECE_TYPES:
+        offset = (color * 6 + piece_type - 1) * 64
+        for square in chess.scan_forward(board.pieces_mask(piece_type, color)):
+            positional += PST[offset + square]
+    return positional
+
+
+class SearchBoard(chess.Board):
+    """
+    Board that keeps material and piece-square totals up to date incrementally.
+    
+    The totals are adjusted on every push and restored on every pop, so the
+    evaluation can read them instead of rescanning the board at each leaf.
+    The position should only be changed through push and pop.
+    """
+    
+    def __init__(self, fen=chess.STARTING_FEN, *, chess960=False):
+        self.material = [0, 0]
+        self.pst = [0, 0]
+        self._eval_stack = []
+        super().__init__(fen, chess960=chess960)
+        self.refresh_eval()
+    
+    @classmethod
+    def from_board(cls, board: chess.Board) -> "SearchBoard":
+        """Create a search board with the same position and move history."""
+        search_board = cls(board.root().fen(), chess960=board.chess960)
+        for move in board.move_stack:
+            search_board.push(move)
+        return search_board
+    
+    def refresh_eval(self):
+        """Recompute the material and piece-square totals from scratch."""
+        for color in chess.COLORS:
+            self.material[color] = count_material(self, color)
+            self.pst[color] = count_positional(self, color)
+    
+    def copy(self, *, stack=True):
+        board = super().copy(stack=stack)
+        board.refresh_eval()
+        return board
+    
+    def push(self, move: chess.Move):
+        material = self.material
+        pst = self.pst
+        self._eval_stack.append((material[0], material[1], pst[0], pst[1]))
+        
+        if move:
+            color = self.turn
+            from_square = move.from_square
+            to_square = move.to_square
+            piece_type = self.piece_type_at(from_square)
+            color_offset = color * 384  # 6 piece types * 64 squares
+            
+            # Only king moves can castle and only pawn moves can capture en passant
+            if piece_type == chess.KING and self.is_castling(move):
+                # Move both the king and the rook
+                rank = chess.square_rank(from_square)
+                kingside = self.is_kingside_castling(move)
+                if self.occupied_co[color] & chess.BB_SQUARES[to_square]:
+                    rook_from = to_square
+                else:
+                    rook_from = chess.square(7 if kingside else 0, rank)
+                king_to = chess.square(6 if kingside else 2, rank)
+                rook_to = chess.square(5 if kingside else 3, rank)
+                king_offset = color_offset + (chess.KING - 1) * 64
+                rook_offset = color_offset + (chess.ROOK - 1) * 64
+                pst[color] += (PST[king_offset + king_to] - PST[king_offset + from_square] +
+                               PST[rook_offset + rook_to] - PST[rook_offset + rook_from])
+            else:
+                # Remove a captured piece
+                if piece_type == chess.PAWN and self.is_en_passant(move):
+                    captured_square = to_square - 8 if color == chess.WHITE else to_square + 8
+                    captured_type = chess.PAWN
+                else:
+                    captured_square = to_square
+                    captured_type = self.piece_type_at(to_square)
+                if captured_type:
+                    opponent = not color
+                    material[opponent] -= MATERIAL_VALUES[captured_type]
+                    pst[opponent] -= PST[(opponent * 6 + captured_type - 1) * 64 + captured_square]
+                
+                # Move the piece, changing its type on promotion
+                new_type = move.promotion or piece_type
+                material[color] += MATERIAL_VALUES[new_type] - MATERIAL_VALUES[piece_type]
+                pst[color] += (PST[color_offset + (new_type - 1) * 64 + to_square] -
+                               PST[color_offset + (piece_type - 1) * 64 + from_square])
+        
+        super().push(move)
+    
+    def pop(self) -> chess.Move:
+        move = super().pop()
+        if self._eval_stack:
+            material = self.material
+            pst = self.pst
+            material[0], material[1], pst[0], pst[1] = self._eval_stack.pop()
+        else:
+            # Popping history that was never pushed on this board
+            self.refresh_eval()
+        return move
+
+
 def evaluate_mobility(board: chess.Board) -> int:
-    """Evaluate piece mobility (number of legal moves)."""
-    current_player_mobility = len(list(board.legal_moves))
+    """
+    Evaluate piece mobility from White's perspective.
     
-    # Switch turns to count opponent mobility
-    board.push(chess.Move.null())
-    opponent_mobility = len(list(board.legal_moves))
-    board.pop()
+    Mobility is approximated by the number of squares each piece attacks that
+    are not occupied by its own side, which avoids generating legal moves.
+    """
+    mobility = [0, 0]
+    for color in chess.COLORS:
+        own_pieces = board.occupied_co[color]
+        for square in chess.scan_forward(own_pieces):
+            mobility[color] += chess.popcount(board.attacks_mask(square) & ~own_pieces)
     
-    return (current_player_mobility - opponent_mobility) * 10
+    return (mobility[chess.WHITE] - mobility[chess.BLACK]) * 10
 
 
 def evaluate_king_safety(board: chess.Board, color: chess.Color) -> int:
@@ -44,40 +196,14 @@ def evaluate_king_safety(board: chess.Board, color: chess.Color) -> int:
     safety_score = 0
     
     # Bonus for castling
-    if board.has_castling_rights(color):
-        if color == chess.WHITE:
-            if board.has_kingside_castling_rights(color):
-                safety_score += 50
-            if board.has_queenside_castling_rights(color):
-                safety_score += 30
-        else:
-            if board.has_kingside_castling_rights(color):
-                safety_score += 50
-            if board.has_queenside_castling_rights(color):
-                safety_score += 30
-    
-    # Penalty for exposed king
-    king_file = chess.square_file(king_square)
-    king_rank = chess.square_rank(king_square)
+    if board.has_kingside_castling_rights(color):
+        safety_score += 50
+    if board.has_queenside_castling_rights(color):
+        safety_score += 30
     
     # Check pawn shield
-    pawn_shield = 0
-    if color == chess.WHITE:
-        for file_offset in [-1, 0, 1]:
-            shield_file = king_file + file_offset
-            if 0 <= shield_file <= 7:
-                shield_square = chess.square(shield_file, king_rank + 1)
-                if board.piece_at(shield_square) == chess.Piece(chess.PAWN, chess.WHITE):
-                    pawn_shield += 30
-    else:
-        for file_offset in [-1, 0, 1]:
-            shield_file = king_file + file_offset
-            if 0 <= shield_file <= 7:
-                shield_square = chess.square(shield_file, king_rank - 1)
-                if board.piece_at(shield_square) == chess.Piece(chess.PAWN, chess.BLACK):
-                    pawn_shield += 30
-    
-    safety_score += pawn_shield
+    shield_pawns = board.pawns & board.occupied_co[color] & KING_SHIELD_MASKS[color][king_square]
+    safety_score += 30 * chess.popcount(shield_pawns)
     
     # Penalty for being in check
     if board.is_check():
@@ -90,62 +216,31 @@ def evaluate_pawn_structure(board: chess.Board) -> int:
     """Evaluate pawn structure (doubled, isolated, passed pawns)."""
     score = 0
     
-    for color in [chess.WHITE, chess.BLACK]:
+    for color in chess.COLORS:
         multiplier = 1 if color == chess.WHITE else -1
-        pawns = board.pieces(chess.PAWN, color)
-        
-        # Count pawns per file
-        files = [0] * 8
-        for pawn_square in pawns:
-            files[chess.square_file(pawn_square)] += 1
+        pawns = board.pawns & board.occupied_co[color]
+        enemy_pawns = board.pawns & board.occupied_co[not color]
         
-        # Penalty for doubled pawns
-        for file_count in files:
+        for file_idx in range(8):
+            file_pawns = pawns & FILE_BB[file_idx]
+            if not file_pawns:
+                continue
+            
+            # Penalty for doubled pawns
+            file_count = chess.popcount(file_pawns)
             if file_count > 1:
                 score += multiplier * (file_count - 1) * -20
-        
-        # Penalty for isolated pawns
-        for file_idx, file_count in enumerate(files):
-            if file_count > 0:
-                has_neighbor = False
-                if file_idx > 0 and files[file_idx - 1] > 0:
-                    has_neighbor = True
-                if file_idx < 7 and files[file_idx + 1] > 0:
-                    has_neighbor = True
-                if not has_neighbor:
-                    score += multiplier * -15  # Isolated pawn penalty
-        
-        # Bonus for passed pawns
-        for pawn_square in pawns:
-            file = chess.square_file(pawn_square)
-            rank = chess.square_rank(pawn_square)
             
-            is_passed = True
-            if color == chess.WHITE:
-                # Check if any black pawns block this pawn's path
-                for check_rank in range(rank + 1, 8):
-                    for check_file in [file - 1, file, file + 1]:
-                        if 0 <= check_file <= 7:
-                            check_square = chess.square(check_file, check_rank)
-                            if board.piece_at(check_square) == chess.Piece(chess.PAWN, chess.BLACK):
-                                is_passed = False
-                                break
-                    if not is_passed:
-                        break
-            else:
-                # Check if any white pawns block this pawn's path
-                for check_rank in range(rank - 1, -1, -1):
-                    for check_file in [file - 1, file, file + 1]:
-                        if 0 <= check_file <= 7:
-                            check_square = chess.square(check_file, check_rank)
-                            if board.piece_at(check_square) == chess.Piece(chess.PAWN, chess.WHITE):
-                                is_passed = False
-                                break
-                    if not is_passed:
-                        break
-            
-            if is_passed:
+            # Penalty for isolated pawns
+            if not pawns & ADJACENT_FILES_BB[file_idx]:
+                score += multiplier * -15  # Isolated pawn penalty
+        
+        # Bonus for passed pawns (no enemy pawn ahead on the same or adjacent files)
+        passed_masks = PASSED_PAWN_MASKS[color]
+        for pawn_square in chess.scan_forward(pawns):
+            if not enemy_pawns & passed_masks[pawn_square]:
                 # Bonus increases as pawn gets closer to promotion
+                rank = chess.square_rank(pawn_square)
                 if color == chess.WHITE:
                     bonus = (rank - 1) * 20
                 else:
@@ -179,49 +274,17 @@ def evaluate_board(board: chess.Board) -> int:
     evaluation = 0
     
     # 1. MATERIAL EVALUATION
-    white_material = count_material(board, chess.WHITE)
-    black_material = count_material(board, chess.BLACK)
-    material_balance = white_material - black_material
-    
     # 2. POSITIONAL EVALUATION (Piece-Square Tables)
-    white_positional = 0
-    black_positional = 0
-    
-    # Define piece-square tables for both colors
-    white_psts = {
-        chess.PAWN: PAWN_PST,
-        chess.KNIGHT: KNIGHT_PST,
-        chess.BISHOP: BISHOP_PST,
-        chess.ROOK: ROOK_PST,
-        chess.QUEEN: QUEEN_PST,
-        chess.KING: KING_PST
-    }
-    
-    black_psts = {
-        chess.PAWN: PAWN_PST_BLACK,
-        chess.KNIGHT: KNIGHT_PST_BLACK,
-        chess.BISHOP: BISHOP_PST_BLACK,
-        chess.ROOK: ROOK_PST_BLACK,
-        chess.QUEEN: QUEEN_PST_BLACK,
-        chess.KING: KING_PST_BLACK
-    }
-    
-    # Calculate positional scores
-    for square in chess.SQUARES:
-        piece = board.piece_at(square)
-        if piece is not None:
-            if piece.color == chess.WHITE:
-                white_positional += white_psts[piece.piece_type][square]
-            else:
-                black_positional += black_psts[piece.piece_type][square]
-    
-    positional_balance = white_positional - black_positional
+    if isinstance(board, SearchBoard):
+        # Read the incrementally maintained totals
+        material_balance = board.material[chess.WHITE] - board.material[chess.BLACK]
+        positional_balance = board.pst[chess.WHITE] - board.pst[chess.BLACK]
+    else:
+        material_balance = count_material(board, chess.WHITE) - count_material(board, chess.BLACK)
+        positional_balance = count_positional(board, chess.WHITE) - count_positional(board, chess.BLACK)
     
-    # 3. MOBILITY EVALUATION (only if not too expensive)
-    try:
-        mobility_score = evaluate_mobility(board)
-    except:
-        mobility_score = 0
+    # 3. MOBILITY EVALUATION
+    mobility_score = evaluate_mobility(board)
     
     # 4. KING SAFETY EVALUATION
     white_king_safety = evaluate_king_safety(board, chess.WHITE)
@@ -235,16 +298,15 @@ def evaluate_board(board: chess.Board) -> int:
     tactical_bonus = 0
     
     # Bonus for controlling center squares
-    center_squares = [chess.E4, chess.E5, chess.D4, chess.D5]
-    for square in center_squares:
+    for square in CENTER_SQUARES:
         if board.is_attacked_by(chess.WHITE, square):
             tactical_bonus += 10
         if board.is_attacked_by(chess.BLACK, square):
             tactical_bonus -= 10
     
     # Bishop pair bonus
-    white_bishops = len(board.pieces(chess.BISHOP, chess.WHITE))
-    black_bishops = len(board.pieces(chess.BISHOP, chess.BLACK))
+    white_bishops = chess.popcount(board.pieces_mask(chess.BISHOP, chess.WHITE))
+    black_bishops = chess.popcount(board.pieces_mask(chess.BISHOP, chess.BLACK))
     if white_bishops >= 2:
         tactical_bonus += 30
     if black_bishops >= 2:
@@ -5,7 +5,7 @@ Provides a command-line interface for playing chess against the AI.
 
 import chess
 import time
-from engine import find_best_move, iterative_deepening_search
+from engine import find_best_move, iterative_deepening_search, clear_transposition_table
 
 
 def print_board_with_coordinates(board):
@@ -108,8 +108,9 @@ def main():
     print("🚪 Type 'quit' at any time to exit the game.")
     print("=" * 60)
     
-    # Initialize the chess board
+    # Initialize the chess board and start with an empty transposition table
     board = chess.Board()
+    clear_transposition_table()
     
     # Set search depth for the AI (4-5 is stronger but slower)
     depth = 4
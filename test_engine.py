@@ -0,0 +1,126 @@
+"""
+Regression tests for the chess engine search.
+Run with: python -m unittest
+"""
+
+import random
+import unittest
+
+import chess
+from engine import (
+    find_best_move, iterative_deepening_search, root_search, clear_transposition_table,
+    move_gives_check, static_exchange_evaluation
+)
+from evaluation import SearchBoard, count_material, count_positional
+
+
+def random_boards(seed, games=40, plies=100):
+    """Yield positions from seeded random games, alternating standard and Chess960 starts."""
+    rng = random.Random(seed)
+    for game in range(games):
+        if game % 2:
+            board = chess.Board()
+        else:
+            board = chess.Board.from_chess960_pos(rng.randrange(960))
+        for _ in range(plies):
+            moves = list(board.legal_moves)
+            if not moves:
+                break
+            yield board, moves
+            board.push(rng.choice(moves))
+
+
+class FindBestMoveTest(unittest.TestCase):
+    """Searches from the full window must always produce a legal move."""
+
+    def test_starting_position_depth_4(self):
+        board = chess.Board()
+        move = find_best_move(board, 4)
+        self.assertIsNotNone(move)
+        self.assertIn(move, board.legal_moves)
+
+    def test_finds_back_rank_mate(self):
+        board = chess.Board("6k1/5ppp/8/8/8/8/5PPP/3R2K1 w - - 0 1")
+        self.assertEqual(find_best_move(board, 4), chess.Move.from_uci("d1d8"))
+
+    def test_iterative_deepening_returns_move(self):
+        board = chess.Board()
+        move = iterative_deepening_search(board, 4, time_limit=30.0)
+        self.assertIn(move, board.legal_moves)
+
+    def test_root_fail_low_returns_move(self):
+        clear_transposition_table()
+        board = chess.Board()
+        move, score = root_search(board, 3, 10000, 10001)
+        self.assertIn(move, board.legal_moves)
+        self.assertLessEqual(score, 10000)
+
+
+class MoveGivesCheckTest(unittest.TestCase):
+    """The bitboard check test must agree with python-chess on every legal move."""
+
+    def test_matches_board_gives_check(self):
+        for board, moves in random_boards(seed=1):
+            for move in moves:
+                if move_gives_check(board, move) != board.gives_check(move):
+                    self.fail(f"gives_check mismatch for {move} in {board.fen()}")
+
+
+class SearchBoardTest(unittest.TestCase):
+    """Incremental material and PST totals must match a full recount after push and pop."""
+
+    def assert_totals(self, board):
+        for color in chess.COLORS:
+            if (board.material[color] != count_material(board, color) or
+                    board.pst[color] != count_positional(board, color)):
+                self.fail(f"incremental totals out of sync at {board.fen()}")
+
+    def test_totals_follow_random_games(self):
+        rng = random.Random(3)
+        for game in range(30):
+            if game % 2:
+                board = SearchBoard()
+            else:
+                board = SearchBoard.from_board(chess.Board.from_chess960_pos(rng.randrange(960)))
+            for _ in range(150):
+                moves = list(board.legal_moves)
+                if not moves:
+                    break
+                # Favour castling, en passant and promotion so each delta path is exercised
+                special = [move for move in moves
+                           if move.promotion or board.is_castling(move) or board.is_en_passant(move)]
+                board.push(rng.choice(special if special and rng.random() < 0.5 else moves))
+                self.assert_totals(board)
+            while board.move_stack:
+                board.pop()
+                self.assert_totals(board)
+
+
+class StaticExchangeTest(unittest.TestCase):
+    """Static exchange evaluation on positions with a known outcome."""
+
+    CASES = [
+        # Undefended pawn
+        ("4k3/8/8/3p4/4P3/8/8/4K3 w - - 0 1", "e4d5", 100),
+        # Pawn for pawn
+        ("4k3/8/2p5/3p4/4P3/8/8/4K3 w - - 0 1", "e4d5", 0),
+        # Rook takes an undefended pawn
+        ("1k1r4/1pp4p/p7/4p3/8/P5P1/1PP4P/2K1R3 w - - 0 1", "e1e5", 100),
+        # Knight takes a pawn and is lost to the x-ray defenders
+        ("1k1r3q/1ppn3p/p4b2/4p3/8/P2N2P1/1PP1R1BP/2K1Q3 w - - 0 1", "d3e5", -220),
+        # Doubled rooks win the pawn against a single rook
+        ("3rk3/8/8/3p4/8/8/3R4/3RK3 w - - 0 1", "d2d5", 100),
+        # Recapturing with the queen would lose it, so the rook goes for a pawn
+        ("3rk3/3r4/8/3p4/8/8/3R4/3QK3 w - - 0 1", "d2d5", -400),
+    ]
+
+    def test_known_exchanges(self):
+        for fen, uci, expected in self.CASES:
+            with self.subTest(fen=fen, move=uci):
+                board = chess.Board(fen)
+                self.assertEqual(static_exchange_evaluation(board, chess.Move.from_uci(uci)), expected)
+                self.assertEqual(board.fen(), fen)
+
+
+if __name__ == "__main__":
+    unittest.main()